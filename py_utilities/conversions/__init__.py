@@ -1,10 +1,11 @@
 """
-__updated__ = '2021-09-05'
+__updated__ = '2026-10-15'
 """
 
-from .datetime_conversions import ACCEPTABLE_TIME_CONVERSIONS, str_to_datetime
+from .datetime_conversions import ACCEPTABLE_TIME_CONVERSIONS, str_to_datetime, \
+    str_to_datetimes
 from .str_conversions import ACCEPTABLE_STR_CONVERSIONS, baud_to_kbaud, binary_to_decimal, \
-    binary_to_hex, bytestring_to_decimal, decimal_to_binary, decimal_to_hex, \
-    decode_ascii_from_binary, decode_ascii_from_hex, encode_ascii_to_binary, \
+    binary_to_hex, bytestring_to_decimal, decimal_to_binary, decimal_to_binary_bulk, \
+    decimal_to_hex, decode_ascii_from_binary, decode_ascii_from_hex, encode_ascii_to_binary, \
     encode_ascii_to_decimal, encode_ascii_to_hex, hex_to_binary, hex_to_decimal, hhz_to_mhz, \
     hz_to_mhz, kbaud_to_baud, mhz_to_hz, mhz_to_hhz
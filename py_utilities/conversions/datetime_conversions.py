@@ -1,17 +1,22 @@
 """ Conversions based around getting a datetime object out of a str value.
 
 __functions__:
+    _compile_time_format
     _parse_args
     str_to_datetime
+    str_to_datetimes
 
 @author: dcsteve24
-__python__version__ = 'Py2/Py3'
+__python__version__ = 'Py3'
 __os__ = All
-__updated__ = '2021-09-05'
+__updated__ = '2026-10-15'
 """
 
+import re
+
 from argparse import ArgumentParser
 from datetime import datetime
+from functools import lru_cache
 
 # A list of the conversion function present. For use as value checks.
 ACCEPTABLE_TIME_CONVERSIONS = ['str_to_datetime']
@@ -19,10 +24,23 @@ ACCEPTABLE_TIME_CONVERSIONS = ['str_to_datetime']
 
 # Contains str time formats we've come across so far. Add as needed.
 STR_TIME_FORMATS = ['%Y-%m-%d %H:%M:%S.%f',
-                    '%Y-%m-%d %H:%M:%S.%f',
                     '%Y-%m-%d %H:%M:%S',
                     '%Y-%m-%d %H:%M',
                     '%Y-%m-%d']
+# Need to match the largest first or we could get an unexpected value. Deduped and sorted once here
+# into an immutable tuple instead of sorting the shared list on every call.
+STR_TIME_FORMATS = tuple(sorted(dict.fromkeys(STR_TIME_FORMATS), key=len, reverse=True))
+# The last format that matched a string of a given length. Columns tend to be dominated by one
+# format so trying this first skips the failed strptime calls.
+_FORMAT_BY_LEN = {}
+# Regex equivalents of the strptime directives. Named after the datetime args they fill.
+_DIRECTIVE_PATTERNS = {'%Y': r'(?P<year>\d{4})',
+                       '%m': r'(?P<month>\d{2})',
+                       '%d': r'(?P<day>\d{2})',
+                       '%H': r'(?P<hour>\d{2})',
+                       '%M': r'(?P<minute>\d{2})',
+                       '%S': r'(?P<second>\d{2})',
+                       '%f': r'(?P<microsecond>\d{1,6})'}
 
 
 def _parse_args():
@@ -35,8 +53,37 @@ def _parse_args():
     return parser.parse_args()
 
 
+def _compile_time_format(time_format):
+    """ Compiles a strptime format into an equivalent regex so we don't pay for strptime reparsing
+    the format on every call.
+
+    Args:
+        time_format: Str. The strptime format to compile.
+
+    Returns:
+        The compiled regex or None if the format uses a directive we don't have a pattern for. Those
+        formats are left to strptime.
+    """
+    pattern = []
+    for piece in re.split('(%.)', time_format):
+        if piece.startswith('%'):
+            if piece not in _DIRECTIVE_PATTERNS:
+                return None
+            pattern.append(_DIRECTIVE_PATTERNS[piece])
+        else:
+            pattern.append(re.escape(piece))
+    return re.compile(''.join(pattern))
+
+
+# Compiled regexes of the above formats, in the same largest first order.
+_TIME_FORMAT_PATTERNS = tuple(pattern for pattern in map(_compile_time_format, STR_TIME_FORMATS)
+                              if pattern is not None)
+
+
+@lru_cache(maxsize=4096)
 def str_to_datetime(string):
-    """ Converts a string into a datetime object.
+    """ Converts a string into a datetime object. Results are cached per string since columns of
+    logs/CSVs tend to repeat the same timestamps.
 
     Args:
         string: The value we want to convert
@@ -44,17 +91,63 @@ def str_to_datetime(string):
     Returns:
         datetime object based on the string value passed
     """
-    # Need to match the largest first or we could get an unexpected value.
-    STR_TIME_FORMATS.sort(key=len, reverse=True)
-    for time_format in STR_TIME_FORMATS:
+    for pattern in _TIME_FORMAT_PATTERNS:
+        match = pattern.fullmatch(string)
+        if match is not None:
+            fields = match.groupdict()
+            microsecond = fields.pop('microsecond', None)
+            fields = {name: int(value) for name, value in fields.items()}
+            if microsecond is not None:
+                # Like strptime, %f is right padded ('12' -> 120000).
+                fields['microsecond'] = int(microsecond.ljust(6, '0'))
+            try:
+                return datetime(**fields)
+            except ValueError:
+                # Out of range value (e.g. month 13). Let strptime have the final say.
+                break
+    # Fallback for strings the regexes don't cover (e.g. single digit months).
+    string_len = len(string)
+    last_format = _FORMAT_BY_LEN.get(string_len)
+    if last_format is not None:
         try:
-            return datetime.strptime(string, time_format)
+            return datetime.strptime(string, last_format)
         except ValueError:
             pass
+    for time_format in STR_TIME_FORMATS:
+        if time_format == last_format:
+            continue
+        try:
+            result = datetime.strptime(string, time_format)
+        except ValueError:
+            continue
+        _FORMAT_BY_LEN[string_len] = time_format
+        return result
     raise ValueError(
         'Could not find a timestamp match for %s. Add a matching time format.' % string)
 
 
+def str_to_datetimes(strings):
+    """ Converts an iterable of strings into datetime objects. Meant for bulk callers (e.g. a column
+    of a log or CSV); each unique string is only parsed once.
+
+    Args:
+        strings: Iterable of str values we want to convert.
+
+    Returns:
+        List of datetime objects in the same order as the strings passed.
+
+    Raises:
+        ValueError: One of the strings did not match a time format.
+    """
+    parsed = {}
+    results = []
+    for string in strings:
+        if string not in parsed:
+            parsed[string] = str_to_datetime(string)
+        results.append(parsed[string])
+    return results
+
+
 # Allows testing with datetime_conversions.py <conversion_function> <string_value>
 if __name__ == '__main__':
     args = _parse_args()
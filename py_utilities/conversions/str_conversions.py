@@ -5,6 +5,16 @@ This was designed as for custom command use in Splunk hence the str in str out r
 
 __constants__:
     ACCEPTABLE_CONVERSIONS
+    _BYTE_TO_BINARY
+    _BYTE_TO_DECIMAL
+    _HEX_TO_NIBBLE
+    _HECTO_TO_MEGA
+    _KILO
+    _MEGA
+    _MEGA_TO_HECTO
+    _MICRO
+    _MILLI
+    _NO_WHITESPACE
 
 __functions__:
     _parse_args
@@ -15,6 +25,7 @@ __functions__:
     binary_to_hex
     bytestring_to_decimal
     decimal_to_binary
+    decimal_to_binary_bulk
     decimal_to_hex
     decode_ascii_from_binary
     decode_ascii_from_hex
@@ -31,14 +42,11 @@ __functions__:
 
 
 @author: dcsteve24
-__python__version__ = 'Py2/Py3'
+__python__version__ = 'Py3'
 __os__ = All
-__updated__ = '2021-09-05'
+__updated__ = '2026-10-15'
 """
 
-import binascii
-import codecs
-
 from argparse import ArgumentParser
 
 
@@ -48,6 +56,25 @@ ACCEPTABLE_STR_CONVERSIONS = [
     'decimal_to_binary', 'decimal_to_hex', 'decode_ascii_from_binary', 'decode_ascii_from_hex',
     'encode_ascii_to_binary', 'encode_ascii_to_decimal', 'encode_ascii_to_hex', 'hex_to_binary',
     'hex_to_decimal', 'hhz_to_mhz', 'hz_to_mhz', 'kbaud_to_baud', 'mhz_to_hhz', 'mhz_to_hz']
+# Lookup table of the 8 bit binary representation of every byte value.
+_BYTE_TO_BINARY = ['{:08b}'.format(i) for i in range(256)]
+# Lookup table of the decimal representation of every byte value.
+_BYTE_TO_DECIMAL = [str(i) for i in range(256)]
+# Lookup table of every byte value to the nibble it represents as a hex character. Anything that
+# isn't a hex character is 0xFF.
+_HEX_TO_NIBBLE = bytearray(b'\xff' * 256)
+for _nibble, _char in enumerate('0123456789abcdef'):
+    _HEX_TO_NIBBLE[ord(_char)] = _HEX_TO_NIBBLE[ord(_char.upper())] = _nibble
+del _nibble, _char
+# Unit multipliers for the rate/frequency conversions.
+_KILO = 1e3
+_MILLI = 1e-3
+_MEGA = 1e6
+_MICRO = 1e-6
+_HECTO_TO_MEGA = 1e-4
+_MEGA_TO_HECTO = 1e4
+# Translation table dropping the whitespace between nibbles/bytes in a single pass.
+_NO_WHITESPACE = str.maketrans('', '', ' \t\n')
 
 
 def _parse_args():
@@ -61,7 +88,8 @@ def _parse_args():
 
 
 def _strip_binary(binary):
-    """ Strips a binary value to just the binary itself; removing any spaces and the '0b' indicator.
+    """ Strips a binary value to just the binary itself; removing any spaces (or tabs/newlines) and
+    the '0b' indicator.
 
     Args:
         binary: Str value containing the binary representation with or without the 0b and/or spaces
@@ -70,11 +98,12 @@ def _strip_binary(binary):
     Returns:
         The binary value back without spaces and the '0b' indicator.
     """
-    return binary.split('b')[-1].replace(' ', '')
+    return binary.translate(_NO_WHITESPACE).rpartition('b')[2]
 
 
 def _strip_hex(hex_value):
-    """ Strips a hex value to just the hex itself; removing any spaces and the '0x' indicator.
+    """ Strips a hex value to just the hex itself; removing any spaces (or tabs/newlines) and the
+    '0x' indicator.
 
     Args:
         hex_value: Str value containing the hex representation with or without the 0x and or/spaces.
@@ -82,7 +111,7 @@ def _strip_hex(hex_value):
     Returns:
         The hex value back withour spaces and the '0x' indicator.
     """
-    return hex_value.split('x')[-1].replace(' ', '')
+    return hex_value.translate(_NO_WHITESPACE).rpartition('x')[2]
 
 
 def baud_to_kbaud(bauds):
@@ -94,7 +123,7 @@ def baud_to_kbaud(bauds):
     Return:
         Str value of the kbaud (kilo symbols per second)
     """
-    return str(float(bauds) * 10 ** -3)
+    return str(float(bauds) * _MILLI)
 
 
 def binary_to_decimal(binary):
@@ -145,9 +174,22 @@ def decimal_to_binary(decimal):
     Returns:
         Str value of the binary representation and without the 0b. Always returns 8 bits.
     """
-    binary = _strip_binary(bin(int(decimal)))
-    binary_len = len(binary)
-    return binary if binary_len == 8 else '0'*(8-binary_len) + binary
+    return '{:08b}'.format(int(decimal))
+
+
+def decimal_to_binary_bulk(decimals):
+    """ Converts many decimal representations to binary representations. For bulk callers (e.g.
+    Splunk ingestion); byte sized values come straight out of a lookup table.
+
+    Args:
+        decimals: Iterable of str (or int) values containing the decimal representations.
+
+    Returns:
+        List of str values of the binary representations and without the 0b. Same as
+        decimal_to_binary per value.
+    """
+    return [_BYTE_TO_BINARY[value] if 0 <= value < 256 else '{:08b}'.format(value)
+            for value in map(int, decimals)]
 
 
 def decimal_to_hex(decimal):
@@ -159,7 +201,7 @@ def decimal_to_hex(decimal):
     Return:
         Str value of hex representation and without the 0x
     """
-    return _strip_hex(hex(int(decimal)))
+    return '{:x}'.format(int(decimal))
 
 
 def decode_ascii_from_binary(binary):
@@ -189,14 +231,16 @@ def decode_ascii_from_hex(hex_value):
         Str value containing the ascii of the hex representation passed. If a bad hex value is
         contained it will pass back a '0' value. So you may end up with something like 'Taco 0ell'.
     """
-    stripped_hex = _strip_hex(hex_value)
-    hex_list = [stripped_hex[i:i+2] for i in range(0, len(stripped_hex), 2)]
-    for i, grouping in enumerate(hex_list):
-        try:
-            hex_list[i] = str(codecs.decode(codecs.decode(grouping, 'hex'), 'ascii'))
-        except UnicodeDecodeError:
-            hex_list[i] - '0'
-    return ''.join(hex_list)
+    # Non ascii characters become '?' which is a bad hex value like any other.
+    hex_bytes = _strip_hex(hex_value).encode('ascii', 'replace')
+    if len(hex_bytes) % 2:
+        # A lone trailing character can't make a byte, pad it so it comes back as a bad value.
+        hex_bytes += b'?'
+    # Bad nibbles are 0xFF so any pair containing one lands above the ascii range along with the
+    # non ascii bytes; all of which become '0'.
+    byte_values = [(_HEX_TO_NIBBLE[high] << 4) | _HEX_TO_NIBBLE[low]
+                   for high, low in zip(hex_bytes[::2], hex_bytes[1::2])]
+    return bytes([value if value < 0x80 else 0x30 for value in byte_values]).decode('ascii')
 
 
 def encode_ascii_to_binary(ascii_value):
@@ -208,7 +252,7 @@ def encode_ascii_to_binary(ascii_value):
     Returns:
         Str value of the ascii encoded binary representation.
     """
-    return hex_to_binary(encode_ascii_to_binary(ascii_value))
+    return ''.join([_BYTE_TO_BINARY[byte] for byte in ascii_value.encode('ascii')])
 
 
 def encode_ascii_to_decimal(ascii_value):
@@ -218,9 +262,15 @@ def encode_ascii_to_decimal(ascii_value):
         ascii_value: Str value containing the value to convert.
 
     Returns:
-        Str value of the ascii encoded decimal representation.
+        Str value of the ascii encoded decimal representation. Characters outside of ascii come
+        back as their code point ('é' -> '233').
     """
-    return ''.join(format(ord(val), 'd') for val in ascii_value)
+    try:
+        # latin-1 maps every code point under 256 straight to its byte value.
+        return ''.join([_BYTE_TO_DECIMAL[byte] for byte in ascii_value.encode('latin-1')])
+    except UnicodeEncodeError:
+        return ''.join([_BYTE_TO_DECIMAL[code] if code < 256 else str(code)
+                        for code in map(ord, ascii_value)])
 
 
 def encode_ascii_to_hex(ascii_value):
@@ -232,7 +282,7 @@ def encode_ascii_to_hex(ascii_value):
     Returns:
         Str value of the ascii encoded hex representation.
     """
-    return binascii.hexlify(ascii_value)
+    return ascii_value.encode('ascii').hex().upper()
 
 
 def hex_to_binary(hex_value):
@@ -246,14 +296,8 @@ def hex_to_binary(hex_value):
         Str value of the binary representation and without the 0b. Always returns 8 bits.
     """
     stripped_hex = _strip_hex(hex_value)
-    # Bin doesn't return preleading 0's. So grab the expected length and add 0's as fill.
-    hex_length = len(stripped_hex)
-    binary = _strip_binary(bin(int(stripped_hex, 16)))
-    binary_len = len(binary)
-    if binary_len != hex_length * 4:
-        return '0' * ((hex_length * 4) - binary_len) + binary
-    else:
-        return binary
+    # Zero fill to 4 bits per hex character so preleading 0's are kept.
+    return '{:0{}b}'.format(int(stripped_hex, 16), len(stripped_hex) * 4)
 
 
 def hex_to_decimal(hex_value):
@@ -277,7 +321,7 @@ def hhz_to_mhz(hhz):
     Returns:
         Str value of the frequency in MHz (MegaHertz)
     """
-    return str(float(hhz) * 10 ** -4)
+    return str(float(hhz) * _HECTO_TO_MEGA)
 
 
 def hz_to_mhz(hz):
@@ -289,7 +333,7 @@ def hz_to_mhz(hz):
     Returns:
         Str value of the frequency in MHz (MegaHertz)
     """
-    return str(float(hz) * 10 ** -6)
+    return str(float(hz) * _MICRO)
 
 
 def kbaud_to_baud(kbaud):
@@ -301,7 +345,7 @@ def kbaud_to_baud(kbaud):
     Returns:
         Str value of baud (symbols per second)
     """
-    return str(float(kbaud) * 10 ** 3)
+    return str(float(kbaud) * _KILO)
 
 
 def mhz_to_hz(mhz):
@@ -313,7 +357,7 @@ def mhz_to_hz(mhz):
     Returns:
         Str value of the frequency in Hz (Hertz)
     """
-    return str(float(mhz) * 10 ** 6)
+    return str(float(mhz) * _MEGA)
 
 
 def mhz_to_hhz(mhz):
@@ -325,7 +369,7 @@ def mhz_to_hhz(mhz):
     Returns:
         Str value of the frequency in hHz (HectoHertz).
     """
-    return str(float(mhz) * 10 ** -4)
+    return str(float(mhz) * _MEGA_TO_HECTO)
 
 
 # Allows testing with string_conversions.py <conversion_function> <string_value>
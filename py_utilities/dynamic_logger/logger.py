@@ -20,19 +20,24 @@ __constants__:
 
 __functions__:
     _level_value_check
+    _stop_listener
     create_logger
     log_message
 
 @author: dcsteve24
-__python_version__ = Py2/Py3
+__python_version__ = Py3
 __os__ = Windows/Linux
-__updated__ = '2021-09-04'
+__updated__ = '2026-10-15'
 """
 
+import atexit
 import logging.handlers
 import os
+import queue
 import sys
 
+from functools import lru_cache
+
 # Default logging path to the home directory -- for troubleshooting/debugging
 _DEFAULT_LOGGING_PATH = os.path.join(os.path.expanduser('~'), 'python_debug.log')
 # Logging Format
@@ -47,9 +52,11 @@ ACCEPTED_LOG_LEVELS = {'debug': logging.DEBUG,  # 10
                        'fatal': logging.FATAL}  # 50
 
 
+@lru_cache(maxsize=32, typed=True)
 def _level_value_check(level):
     """ Helper to check values of the passed log level to ensure a proper value is set. Also
     converts to an int if a str type is passed. Errors if the value is not an acceptable value.
+    Results are cached since this runs on every log_message call with the same handful of values.
 
     Args:
         level: Str or Int. The log level trying to be utilized. See the above global for acceptable
@@ -60,6 +67,8 @@ def _level_value_check(level):
 
     Raises:
         ValueError: Bad log level value was passed.
+        TypeError: An unhashable log level value was passed (e.g. a list). The cache needs to hash
+            the value before this can check it.
     """
     if type(level) is int:
         if level in ACCEPTED_LOG_LEVELS.values():
@@ -73,12 +82,24 @@ def _level_value_check(level):
         (', '.join(ACCEPTED_LOG_LEVELS), ', '.join(str(x) for x in ACCEPTED_LOG_LEVELS.values())))
 
 
-def create_logger(log_path=DEFAULT_LOGGING_PATH,
+def _stop_listener(listener):
+    """ Stops a QueueListener at exit, flushing anything still queued. Skips listeners the caller
+    already stopped since QueueListener.stop errors when called twice.
+
+    Args:
+        listener: The logging.handlers.QueueListener to stop.
+    """
+    if listener._thread is not None:
+        listener.stop()
+
+
+def create_logger(log_path=_DEFAULT_LOGGING_PATH,
                   level='info',
-                  identifiter=__name__,
+                  identifier=__name__,
                   backup_count=5,
                   rotate_size=10737418240,
-                  console_output=False):
+                  console_output=False,
+                  async_io=True):
     """ Configures and returns a Python logger object. If one already exists for the name, it will
     return that one instead of creating it.
 
@@ -111,6 +132,9 @@ def create_logger(log_path=DEFAULT_LOGGING_PATH,
             console_output: Bool. If True will add a stdout handler which serves the same purpose
                 of print statements. You will get the same log message in both the console and the
                 file.
+            async_io: Bool. If True the handlers are run by a background QueueListener thread (kept
+                on the logger as _listener) and the logger itself only queues records. This keeps
+                the file IO out of the caller's thread for hot logging loops. Defaults to True.
 
     Returns:
         The configured Python logging object. PASSING THIS AROUND IS OPTIONAL (not recommended).
@@ -118,7 +142,7 @@ def create_logger(log_path=DEFAULT_LOGGING_PATH,
     # Value check and force to int
     level = _level_value_check(level)
     # Create/Grab logger object
-    logger = logging.getLogger(identifiter)
+    logger = logging.getLogger(identifier)
     if not getattr(logger, 'handlers', None):
         logger.setLevel(level)
         logger.propagate = False
@@ -126,18 +150,33 @@ def create_logger(log_path=DEFAULT_LOGGING_PATH,
         log_handler = logging.handlers.RotatingFileHandler(
             log_path, maxBytes=rotate_size, backupCount=backup_count, mode='a')
         log_handler.setLevel(level)
-        log_handler.setFormatter(FORMATTER)
-        logger.addHandler(log_handler)
+        log_handler.setFormatter(_FORMATTER)
+        if async_io:
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            logger._listener = logging.handlers.QueueListener(log_queue, log_handler,
+                                                              respect_handler_level=True)
+            logger._listener.start()
+            # Flushes anything still queued on exit.
+            atexit.register(_stop_listener, logger._listener)
+        else:
+            logger.addHandler(log_handler)
+    # With async_io the real handlers live on the listener instead of the logger.
+    listener = getattr(logger, '_listener', None)
+    handlers = listener.handlers if listener else logger.handlers
     # Configure console output handler
-    if console_output and logging.StreamHandler not in (type(x) for x in logger.handlers):
+    if console_output and logging.StreamHandler not in (type(x) for x in handlers):
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
-        console_handler.setFormatter(FORMATTER)
-        logger.addHandler(console_handler)
+        console_handler.setFormatter(_FORMATTER)
+        if listener:
+            listener.handlers += (console_handler,)
+        else:
+            logger.addHandler(console_handler)
     return logger
 
 
-def log_message(level, message, logger_id=__name__):
+def log_message(level, message, *args, logger_id=__name__, **kwargs):
     """ Helper to log a message to the passed logger. Prevents need of importing/knowing the logging
     module INFO, DEBUG, etc. in your module and prevents the passing of the object around; though
     you can still do this if desired. Instead, call this with the logger_id defaults or set a global
@@ -145,20 +184,31 @@ def log_message(level, message, logger_id=__name__):
 
     Recommend creating a logger before running this so you get the functionality you expect!
 
+    Pass values to the message with %s placeholders and args (e.g. log_message('debug', 'x=%s', x))
+    rather than formatting it yourself. The message is then only formatted if it is actually logged.
+
     Args:
         level: Str or Int. The level of the log message. See the global above for acceptable values.
-        message: Str. The message we are logging.
+        message: Str. The message we are logging. Can contain %-style placeholders filled by args.
 
         Optional:
+            args: The values for the placeholders in message.
             logger_id: Str or logging.Logger object. The logger unique identifier to use for logging
                 or the configured logging.Logger object. If a logger with the logger identifier
                 exists in this Python instance it will pull that logger and its configurations and
                 log to it. If this object does not exist, it will create it with the default args
-                in create_logger.
+                in create_logger. Must be passed as a keyword.
+            kwargs: Passed through to logging.Logger.log (e.g. exc_info, stack_info, extra).
     """
     level = _level_value_check(level)
-    if type(logger_id) is logging.Logger:
+    if isinstance(logger_id, logging.Logger):
         logger = logger_id
     else:
-        logger = create_logger(identifier=logger_id)
-    logger.log(level, message)
+        logger = logging.getLogger(logger_id)
+        # Only bootstrap with the create_logger defaults the first time we see this identifier.
+        if not logger.handlers:
+            logger = create_logger(identifier=logger_id)
+    # Bail before doing anything else if the logger would throw the message away anyways.
+    if not logger.isEnabledFor(level):
+        return
+    logger.log(level, message, *args, **kwargs)
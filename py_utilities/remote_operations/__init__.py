@@ -1,6 +1,7 @@
 """
-__updated__ = '2021-09-04'
+__updated__ = '2026-10-15'
 """
 
 from .pick_unused_port import NoCommandFoundError, NoPortsFound, pick_port
-from .remote_linux_commands import RemoteCommandError, remote_operations
+from .remote_linux_commands import RemoteCommandError, remote_operations, \
+    remote_operations_many
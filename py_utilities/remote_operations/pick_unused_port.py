@@ -6,19 +6,32 @@ __classes__:
     NoPortsFound
 
 __functions__:
+    _local_listening_ports
+    _remote_listening_ports
     pick_port
 
 @author: dcsteve24
-__python_version__ = Py2/Py3
+__python_version__ = Py3
 __os__ =  Linux
-__updated__ = '2021-09-04'
+__updated__ = '2026-10-15'
 """
 
 import re
-import subprocess
 
 from .remote_linux_commands import remote_operations
 
+# The kernel socket tables for the protocols netstat -tuln would show.
+_PROC_NET_FILES = ('/proc/net/tcp', '/proc/net/tcp6', '/proc/net/udp', '/proc/net/udp6')
+# Socket states (hex) in the above tables for listeners. TCP LISTEN and unconnected UDP.
+_LISTEN_STATES = ('0A', '07')
+# Pulls the local port out of each line of ss -tulnH output
+# (Netid State Recv-Q Send-Q Local_Address:Port Peer_Address:Port).
+_SS_LISTEN_RE = re.compile(r'^\S+\s+\S+\s+\d+\s+\d+\s+\S*:(\d+)\s', re.MULTILINE)
+# Pulls the remote listeners. ss's stderr is folded into the output so only SSH's own messages are
+# left in stderr, and a missing ss is reported the same way regardless of the remote shell.
+_SS_COMMAND = ('if command -v ss > /dev/null; then ss -tulnH 2>&1; '
+               'else echo "ss: command not found"; fi')
+
 
 class NoCommandFoundError(Exception):
     pass
@@ -28,14 +41,67 @@ class NoPortsFound(Exception):
     pass
 
 
+def _local_listening_ports():
+    """ Reads the listening ports of this host straight out of the kernel socket tables instead of
+    shelling out.
+
+    Returns:
+        Set of the listening port numbers (int).
+    """
+    ports = set()
+    for path in _PROC_NET_FILES:
+        try:
+            with open(path) as proc_file:
+                lines = proc_file.readlines()[1:]  # Skips the header
+        except (IOError, OSError):
+            # e.g. IPv6 is disabled
+            continue
+        for line in lines:
+            # sl local_address rem_address st ... with local_address as <hex ip>:<hex port>
+            fields = line.split()
+            if fields[3] in _LISTEN_STATES:
+                ports.add(int(fields[1].rpartition(':')[2], 16))
+    return ports
+
+
+def _remote_listening_ports(host, ssh_port, banner_size=0):
+    """ Pulls the listening ports of a remote host using ss over SSH.
+
+    Args:
+        host: Str. The host we are grabbing the ports from. Can be an IP or hostname.
+        ssh_port: The port to use for SSH connectivity.
+
+        Optional:
+            banner_size: Int. Lines of login banner to throw away from the SSH stderr.
+
+    Returns:
+        Set of the listening port numbers (int).
+
+    Raises:
+        NoCommandFoundError: ss is not installed on the host.
+        RemoteCommandError: SSH failed or ss errored (e.g. an older ss without -H). Raised instead
+            of returning an empty set that would make every port look free.
+    """
+    results = remote_operations(remote_host=host, commands=[_SS_COMMAND], port=ssh_port,
+                                catch_errors=True, banner_size=banner_size)
+    if any('command not found' in line for line in results):
+        raise NoCommandFoundError('ss is not installed on the %s device. Please install it'
+                                  ' (iproute2) and try again' % host)
+    # One pass over the whole output. Anything that isn't a socket line (banners, warnings) just
+    # doesn't match.
+    return set(map(int, _SS_LISTEN_RE.findall(''.join(results))))
+
+
 def pick_port(host,
               port_min,
               port_max,
-              ssh_port=22):
-    """ Picks an unused port within the desired range (min, max) and returns it
+              ssh_port=22,
+              banner_size=0):
+    """ Picks an unused port within the desired range (min, max inclusive) and returns it
 
-    This command will ssh into the passed host, pull the open listening ports, and then pick
-    the first usable port within the desired range.
+    This command will pull the open listening ports of the passed host (from the kernel socket
+    tables if local, otherwise with ss over SSH), and then pick the first usable port within the
+    desired range.
 
     Args:
         host: Str. The host we are grabbing the port range from. CAn be an IP or hostname.
@@ -45,26 +111,22 @@ def pick_port(host,
         Optional:
             ssh_port: The port to use for SSH connectivity. Not used if host is set to 'local' or
                 None.
+            banner_size: Int. Lines of login banner the host prints to stderr on SSH. These are
+                thrown away so they aren't taken as an error. Not used if host is local.
 
     Returns:
         The found unused port within the range. If one is not found, this returns None.
+
+    Raises:
+        NoCommandFoundError: ss is not installed on the remote host.
+        RemoteCommandError: Could not SSH into the remote host or ss errored.
     """
-    # Build a list of current listener ports
-    command = ['netstat -tulnp']
+    # Build a set of current listener ports
     if host is None or 'local' in host:
-        subp = subprocess.Popen(command, shell=True, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE, universal_newlines=True, buffsize=0)
-        results = subp.stdout.readlines()
-        subp.terminate()
-    else:
-        results = remote_operations(remote_host=host, commands=command, port=ssh_port,
-                                    catch_errors=False, tty_session=True)
-    str_results = ', '.join(results)
-    if 'command not found' in str_results:
-        raise NoCommandFoundError('netstats is not installed on the %s device. Please install it'
-                                  ' and try again' % host)
+        used_ports = _local_listening_ports()
     else:
-        for port in range(port_min, port_max):
-            if not re.search(str(port), results):
-                return port
+        used_ports = _remote_listening_ports(host, ssh_port, banner_size)
+    for port in range(port_min, port_max + 1):
+        if port not in used_ports:
+            return port
     return None
@@ -3,21 +3,36 @@
 Requires:
     - the environment to have SSH keys in place so password authentication is not an issue.
 
+__constants__:
+    _SSH_MULTIPLEX_OPTIONS
+
 __classes__:
     RemoteCommandError
 
 __functions__:
     remote_operations
+    remote_operations_many
 
 @author: dcsteve24
-__python_version__ = Py2/Py3
+__python_version__ = Py3
 __os__ =  Linux
-__updated__ = '2021-09-04'
+__updated__ = '2026-10-15'
 """
 
 import re
 import subprocess
 
+from concurrent.futures import ThreadPoolExecutor
+
+# Reuses a multiplexed SSH connection per host/port/user so back to back calls skip the TCP
+# handshake and key exchange. The master connection lingers for 60s after the last use. The socket
+# lives in the user's private ~/.ssh (not a world writable dir another user could plant it in) and
+# %C is a fixed length hash of the connection details so long hostnames can't overflow the socket
+# path limit.
+_SSH_MULTIPLEX_OPTIONS = ['-o', 'ControlMaster=auto',
+                          '-o', 'ControlPath=~/.ssh/py_utils_%C',
+                          '-o', 'ControlPersist=60s']
+
 
 class RemoteCommandError(Exception):
     pass
@@ -28,7 +43,8 @@ def remote_operations(remote_host,
                       port=22,
                       catch_errors=True,
                       tty_session=False,
-                      banner_size=0):
+                      banner_size=0,
+                      timeout=None):
     """ Uses a SSH subprocess to run the passed command and returns the results.
 
     This function uses the subprocess module to conduct an SSH session on the remote machine. It
@@ -37,12 +53,14 @@ def remote_operations(remote_host,
     testing has shown that some cases have outputs thrown into stderr when they shouldn't be or we
     don't want them to be, so you can flip this to prevent false positive errors.
 
+    The commands are joined and passed as a single SSH invocation (with && when catching errors so
+    it stops at the first failure, otherwise with ;) rather than typed into an interactive shell.
+
     This operates similarly to Ansible where it will SSH, run the commands, and provide back
     outputs.
 
-    TODO: Passing in a command with a dollar sign ends up causing issues. Linux tries to evaluate
-    the dollar sign as a variable which throws everything off. No amount of escapes ('\') seemed to
-    work.
+    Since the commands run in the remote shell, $ variables are expanded there just as if you typed
+    them. Single quote them if you need the literal text.
 
     TODO: Dig into improving this more. There is a lot of room for improvement regarding error
     handling and such.
@@ -53,16 +71,18 @@ def remote_operations(remote_host,
 
         Optional:
             port: Int. The SSH port to use. Defaults to 22.
-            catch_errors: Bool. If True this will raise an error if the stderr has content. In
-                some cases commands will generate data to stderr even when succeeding, in those
-                cases we recommend swapping this to False and checking the results for expected
-                outputs instead. Defaults to True
+            catch_errors: Bool. If True this will raise an error if the stderr has content or a
+                command exits non zero. In some cases commands will generate data to stderr even
+                when succeeding, in those cases we recommend swapping this to False and checking
+                the results for expected outputs instead. Defaults to True
             tty_session: Bool. Determines if you want a tty session established while running
-                commands. Setting this to True edits the ability to read outputs efficiently with
-                current code. However, in cases where sudo is required, this needs to be flipped to
-                True or the command will error. Defaults to False.
+                commands. In cases where sudo is required, this needs to be flipped to True or the
+                command will error. Note a tty merges the commands' stderr into the results, and the
+                ssh client's '(Shared) Connection to <host> closed.' message is ignored when
+                catching errors. Defaults to False.
             banner_size: Int. Banners seem to get thrown into the stderr when logging in. This
                 specifies how many lines to throw away so it doesn't raise a false positive.
+            timeout: Int. Seconds to wait for the commands to finish. Defaults to None (no limit).
 
     Returns:
         The results of the commands ran as a list based on each line returned.
@@ -70,35 +90,65 @@ def remote_operations(remote_host,
     Raises:
         RemoteCommandError: Failed to either SSH, or while performing the commands.
     """
+    ssh_command = ['ssh', remote_host, '-p', str(port), '-o', 'BatchMode=yes'] + \
+        _SSH_MULTIPLEX_OPTIONS
     if tty_session:
-        ssh_command = ['ssh', remote_host, '-p', str(port), '-ttt']
-        ssh_subprocess = subprocess.Popen(ssh_command, shell=False, stdin=subprocess.PIPE,
-                                          universal_newlines=True, buffsize=0)
-    else:
-        ssh_command = 'ssh %s -p %s' % (remote_host, str(port))
-        ssh_subprocess = subprocess.Popen(ssh_command, shell=True, stdin=subprocess.PIPE,
-                                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                          universal_newlines=True, buffsize=0)
-    for command in commands:
-        ssh_subprocess.stdin.write('%s\n' % command)
-    if tty_session:
-        result, error = ssh_subprocess.communicate('logout\n')
-        if catch_errors and error:
-            raise RemoteCommandError('\n'.join(error))
-    else:
-        ssh_subprocess.stdin.close()
-        result = []
-        for line in ssh_subprocess.stdout.readlines():
-            # Without a shell these warnings can be seen in certain environments. So we ditch them.
-            if re.match('Warning: no access to tty|Thus no job control in this shell', line):
-                pass
-            else:
-                result.append(line)
-        if catch_errors:
-            error = ssh_subprocess.stderr.readlines()
-            if banner_size:
-                error = error[banner_size:]  # Throws away the banner
-            if error:
-                raise RemoteCommandError('\n'.join(error))
-        ssh_subprocess.terminate()
+        ssh_command.append('-ttt')
+    ssh_command.append((' && ' if catch_errors else '; ').join(commands))
+    ssh_subprocess = subprocess.Popen(ssh_command, shell=False, stdin=subprocess.DEVNULL,
+                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                      universal_newlines=True)
+    try:
+        output, error = ssh_subprocess.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        ssh_subprocess.kill()
+        ssh_subprocess.communicate()
+        raise RemoteCommandError('Commands on %s did not finish within %s seconds' %
+                                 (remote_host, timeout))
+    result = []
+    for line in output.splitlines(True):
+        # Without a shell these warnings can be seen in certain environments. So we ditch them.
+        if re.match('Warning: no access to tty|Thus no job control in this shell', line):
+            pass
+        else:
+            result.append(line)
+    if catch_errors:
+        error = error.splitlines(True)
+        if banner_size:
+            error = error[banner_size:]  # Throws away the banner
+        if tty_session:
+            # With a tty the ssh client always reports the connection closing on its stderr.
+            error = [line for line in error
+                     if not re.match(r'(Shared c|C)onnection to .* closed\.', line)]
+        if error:
+            raise RemoteCommandError(''.join(error))
+        # The && chain stops quietly at the first failing command so check the exit code as well.
+        if ssh_subprocess.returncode:
+            raise RemoteCommandError('Commands on %s exited with %s' %
+                                     (remote_host, ssh_subprocess.returncode))
     return result
+
+
+def remote_operations_many(remote_hosts, commands, max_workers=32, **kwargs):
+    """ Runs remote_operations against several hosts at once instead of one after the other. Each
+    worker spends its time blocked on its SSH subprocess so threads are enough here.
+
+    Args:
+        remote_hosts: List. The hosts we are going to SSH into. Can be IPs or hostnames.
+        commands: List. The commands you wish to perform on every host.
+
+        Optional:
+            max_workers: Int. The most hosts to run against at the same time. Defaults to 32.
+            kwargs: Passed through to remote_operations (port, catch_errors, etc.).
+
+    Returns:
+        Dict of each host to its remote_operations results.
+
+    Raises:
+        RemoteCommandError: Failed to either SSH, or while performing the commands on a host.
+    """
+    remote_hosts = list(remote_hosts)  # Iterated twice below
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda host: remote_operations(host, commands, **kwargs),
+                               remote_hosts)
+        return dict(zip(remote_hosts, results))